@@ -6,8 +6,8 @@ setup(
     py_modules=["voronoi"],
     packages=find_packages(include=["src"]),
     install_requires=[
-        "Click",
-        "Numpy"
+        "click",
+        "numpy"
     ],
     entry_points={
         'console_scripts': [
@@ -4,8 +4,9 @@ This file contains functions to calculate a Voronoi diagram's vertices and faces
 the output of Guibas and Stolfi's Delaunay triangulation algorithm.
 """
 
-from src.guibas_and_stolfi import Edge
-from math import acos, inf, sqrt, sin
+from src.guibas_and_stolfi import Edge, Face
+from collections.abc import Iterator
+from math import inf
 
 import numpy as np
 
@@ -19,97 +20,89 @@ def calculate_dual(origin: Edge) -> None:
     # Calculate the outer edge ring.
     edge = origin
     outer_edges = [edge]
-    while (edge := edge.rnext) != origin:
+    while (edge := edge.rnext) is not origin:
         outer_edges.append(edge)
     # The dual edges for the outer ring edges "start" at infinity—there are no points
     # beyond this outer ring to triangulate.
-    data = {"origin": (inf, inf), "vertices": [e.org for e in outer_edges]}
+    outer_vertices = [e.org for e in outer_edges]
+    face = Face((inf, inf), outer_vertices)
     for e in outer_edges:
-        e.right.data = data
+        e.right.face = face
 
-    # Calculate all the interior triangles. For each face, check if its left and right
-    # dual edges have been initialized. If not, add the vertices from the three
-    # Delaunay edges that surround it, then calculate the origin using the circumcenter
-    # of the triangle formed by those vertices.
+    # Collect all the interior triangles. For each face, check if its left dual edge
+    # has been initialized. If not, add the vertices from the three Delaunay edges that
+    # surround it. The dual edges leaving the face all share the same Face, since they
+    # share the same origin.
+    faces = []
     for edge in dfs_edges(origin):
-        if edge.left.org is None:
-            edge.left.data["vertices"] = [
-                edge.org,
-                edge.lnext.org,
-                edge.lnext.lnext.org,
-            ]
-            edge.left.org = circumcenter(*edge.left.data["vertices"])
-
-        if edge.right.org is None:
-            edge.right.data["vertices"] = [
-                edge.org,
-                edge.rnext.org,
-                edge.rnext.rnext.org,
-            ]
-            edge.right.org = circumcenter(*edge.right.data["vertices"])
+        if edge.left.face.vertices is None:
+            lnext = edge.lnext
+            ring = (edge, lnext, lnext.lnext)
+            face = Face(None, [r.org for r in ring])
+            for r in ring:
+                r.left.face = face
+            faces.append(face)
+
+    # Calculate the origins of all the faces at once using the circumcenters of the
+    # triangles formed by their vertices.
+    if faces:
+        a, b, c = (
+            np.array([face.vertices[i] for face in faces], dtype=float)
+            for i in range(3)
+        )
+        for face, center in zip(faces, circumcenters(a, b, c).tolist()):
+            face.origin = tuple(center)
 
     # Calculate a reasonable destination for dual edges that go to infinity. This makes
     # the resulting Voronoi diagram go all the way to the edges of the canvas. Otherwise
     # the outer edges might have gaps.
     for e in outer_edges:
-        orthagonal_vector = (np.array(e.org) - np.array(e.dest))[::-1]
-        orthagonal_vector *= np.array([-1, 1])
-        dest = np.array(e.left.org) + orthagonal_vector
-        data = {"origin": tuple(dest), "vertices": e.right.data["vertices"]}
-        e.right.data = data
+        (ox, oy), (dx, dy), (lx, ly) = e.org, e.dest, e.left.org
+        # Rotate the edge's vector a quarter turn to get an orthagonal vector.
+        vx, vy = dy - oy, ox - dx
+        e.right.face = Face((lx + vx, ly + vy), outer_vertices)
 
     # Add dual vertices to every primal edge, which allows easily getting the Voronoi
-    # polygons for the visualization.
+    # polygons for the visualization. Walk the ring of edges around each origin once,
+    # until it returns to the start, and share the vertices with every edge in it.
     for edge in dfs_edges(origin):
-        vertices = [edge.left.org]
-        while (edge := edge.onext).left.org not in vertices:
-            vertices.append(edge.left.org)
-        edge.data["vertices"] = vertices
-
-
-def dfs_edges(e: Edge) -> set[Edge]:
-    """Given a starting edge `e`, perform a depth-first search to find all connected
-    edges in the graph.
+        if edge.face.vertices is not None:
+            continue
+        ring = [edge]
+        e = edge
+        while (e := e.onext) is not edge:
+            ring.append(e)
+        vertices = [r.left.org for r in ring]
+        for r in ring:
+            r.face.vertices = vertices
+
+
+def dfs_edges(e: Edge) -> Iterator[Edge]:
+    """Given a starting edge `e`, perform a depth-first search and yield each connected
+    edge in the graph once.
     """
-    stack: list[Edge] = list()
+    stack: list[Edge] = [e]
     discovered = set()
-    stack.append(e)
-    try:
-        while e := stack.pop():
-            if e not in discovered:
-                discovered.add(e)
-                stack.extend([e.rnext, e.onext, e.dnext, e.lnext])
-    except IndexError:
-        return discovered
-
-
-def circumcenter(a: tuple, b: tuple, c: tuple) -> tuple:
-    """Calculate and return the circumcenter point for a triangle represented by the
-    vertices `a`, `b`, and `c`.
+    while stack:
+        e = stack.pop()
+        if id(e) in discovered:
+            continue
+        discovered.add(id(e))
+        yield e
+        stack.extend((e.onext, e.sym))
+
+
+def circumcenters(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Calculate and return the circumcenter points for the triangles represented by
+    the rows of the `(N, 2)` vertex arrays `a`, `b`, and `c`.
     """
-    angles = (
-        calc_angle(a, b, c),
-        calc_angle(b, c, a),
-        calc_angle(c, a, b),
-    )
-    xs, ys = [tuple(zip(z, angles)) for z in zip(a, b, c)]
-
-    return (
-        sum([point * sin(2 * angle) for point, angle in xs])
-        / sum([sin(2 * angle) for angle in angles]),
-        sum([point * sin(2 * angle) for point, angle in ys])
-        / sum([sin(2 * angle) for angle in angles]),
+    (ax, ay), (bx, by), (cx, cy) = a.T, b.T, c.T
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+
+    return np.column_stack(
+        (
+            (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d,
+            (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d,
+        )
     )
-
-
-def calc_angle(a: tuple, b: tuple, c: tuple) -> float:
-    """Given three points `a`, `b`, and `c` which form a triangle, calculate and return
-    the angle at point `a` using the law of cosines.
-    """
-    A, B, C = dist(b, c), dist(a, c), dist(a, b)
-    return acos((pow(B, 2) + pow(C, 2) - pow(A, 2)) / (2 * B * C))
-
-
-def dist(a: tuple, b: tuple) -> float:
-    """Calculate and return the distance between two points `a` and `b`."""
-    return sqrt(pow(b[0] - a[0], 2) + pow(b[1] - a[1], 2))
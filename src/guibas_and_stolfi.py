@@ -7,8 +7,6 @@ Guibas, L., & Stolfi, J. (1985). Primitivies for the Manipulation of General
     Vol. 4 (No. 2), pp. 74-123. DOI: https://doi.org/10.1145/282918.282923
 """
 
-import numpy as np
-
 
 class Quad:
     """Represents a set of four related Edges: the Edge, its symmetric counterpart, its
@@ -16,6 +14,8 @@ class Quad:
     the first Edge in the Quad.
     """
 
+    __slots__ = ("edges",)
+
     def __init__(self) -> None:
         self.edges = []
 
@@ -43,38 +43,60 @@ class Quad:
 
         quad.edges = [edge, rot, sym, rotsym]
 
+        # Link each Edge directly to its siblings so navigation avoids `rot()`.
+        for i, e in enumerate(quad.edges):
+            e._rotp = quad.edges[(i + 1) & 3]
+            e._sym = quad.edges[i ^ 2]
+            e._rotn = quad.edges[(i - 1) & 3]
+
         return edge
 
     def __repr__(self) -> str:
         return f"Quad{self[0].__repr__()}"
 
 
+class Face:
+    """Holds the data an Edge carries about its origin: the origin point itself and the
+    vertices of the face surrounding it in the dual subdivision. Edges with the same
+    origin may share a Face.
+    """
+
+    __slots__ = ("origin", "vertices")
+
+    def __init__(self, origin: object = None, vertices: list = None) -> None:
+        self.origin = origin
+        self.vertices = vertices
+
+
 class Edge:
+    __slots__ = ("_rot", "_quad", "_sym", "_rotp", "_rotn", "next", "face")
+
     def __init__(self, rot: int, quad: Quad) -> None:
         self._rot = rot
         self._quad = quad
+        self._sym = self._rotp = self._rotn = None  # Linked by `Quad.make()`.
         self.next = None
-        self.data = {"origin": None}
+        self.face = Face()
 
     # ################ Fundamental Methods ################
     @property
     def org(self) -> object:
         """Returns the Edge's origin data."""
-        return self.data["origin"]
+        return self.face.origin
 
     @org.setter
     def org(self, d: object) -> None:
         """Sets the Edge's origin data."""
-        self.data["origin"] = d
+        self.face.origin = d
 
     def rot(self, n: int) -> "Edge":
         """Returns the edge obtained by rotating the given edge `n` times. Each Quad
         contains the four rotated versions of each edge. The given edge's rotation
-        (`e._rot`) added to `n` modulo 4 is used to determine which of the four edges to
-        request form the Quad.
+        (`e._rot`) added to `n` modulo 4 (taken with a bit mask, which also handles
+        negative `n`) is used to determine which of the four edges to request from the
+        Quad.
         """
-        n = (self._rot + n) % 4
-        return self._quad[n]
+        return self._quad.edges[(self._rot + n) & 3]
 
     # ################## Derived Methods ##################
     @property
@@ -82,7 +104,7 @@ class Edge:
         """Returns the given Edge's symmetrical pair. The origin of `e.sym` is the
         destination of `e` and vice-versa (Guibas & Stolfi, 1985, p.80).
         """
-        return self.rot(2)
+        return self._sym
 
     @property
     def dest(self) -> object:
@@ -97,12 +119,12 @@ class Edge:
     @property
     def left(self) -> object:
         """Returns the Edge's left face."""
-        return self.rot(-1)
+        return self._rotn
 
     @property
     def right(self) -> object:
         """Returns the Edge's right face."""
-        return self.rot(1)
+        return self._rotp
     
     @property
     def onext(self) -> "Edge":
@@ -116,21 +138,21 @@ class Edge:
         """Returns the next (counter-clockwise) Edge sharing the same left face (Guibas
         & Stolfi, 1985, p.81).
         """
-        return self.rot(-1).onext.rot(1)
+        return self._rotn.next._rotp
 
     @property
     def rnext(self) -> "Edge":
         """Returns the next (counter-clockwise) Edge sharing the same right face.
         (Guibas & Stolfi, 1985, p.84).
         """
-        return self.rot(1).onext.rot(-1)
+        return self._rotp.next._rotn
 
     @property
     def dnext(self) -> "Edge":
         """Returns the next (counter-clockwise) Edge sharing the same right face and
         destination (Guibas & Stolfi, 1985, p.84).
         """
-        return self.sym.onext.sym
+        return self._sym.next._sym
 
     @property
     def rprev(self) -> "Edge":
@@ -144,7 +166,7 @@ class Edge:
         """Returns the previous (clockwise) Edge sharing the same right face and origin
         (Guibas & Stolfi, 1985, p.84).
         """
-        return self.rot(1).onext.rot(1)
+        return self._rotp.next._rotp
 
     @property
     def lprev(self) -> "Edge":
@@ -165,33 +187,20 @@ class Edge:
         """Returns the previous (clockwise) Edge sharing the same left face and
         destination (Guibas & Stolfi, 1985, p.84).
         """
-        return self.rot(-1).onext.rot(-1)
+        return self._rotn.next._rotn
 
     # ################ Supporting Methods #################
     def __repr__(self) -> str:
         return f"<{self.org}->{self.dest}>"
 
-    def __hash__(self) -> int:
-        """Use the hash of the parent quad in place of its child Edges' hashes."""
-        return hash(self._quad)  # Treat the parent Quad as all the siblings' ID.
-
-    def __eq__(self, other: "Edge") -> bool:
-        """Edges and their symmetric counterparts are equivalent for identity purposes."""
-        return (self.org == other.org and self.dest == other.dest) or (
-            self.org == other.dest and self.dest == other.org
-        )
-
     def delete(self) -> None:
         """Clean up references from this Edge and all its siblings, then delete the
         parent Quad.
         """
         quad = self._quad
-        other_edges = self._quad.edges[: self._rot] + self._quad.edges[self._rot + 1 :]
-        for edge in other_edges:
+        for edge in quad.edges:
             edge.next = None
-            edge._quad = None
-        self.next = None
-        self._quad = None
+            edge._quad = edge._sym = edge._rotp = edge._rotn = None
         del quad
 
 
@@ -203,8 +212,8 @@ def splice(a: Edge, b: Edge) -> None:
 
     (Guibas & Stolfi, 1985, p.96)
     """
-    alpha = a.next.rot(1)
-    beta = b.next.rot(1)
+    alpha = a.next._rotp
+    beta = b.next._rotp
     alpha.next, beta.next = beta.next, alpha.next
     a.next, b.next = b.next, a.next
 
@@ -236,18 +245,24 @@ def in_circle(a: tuple, b: tuple, c: tuple, d: tuple) -> bool:
     is bounded by the oriented circle `abc` and lies to the left of it (Guibas & Stolfi,
     1985, p.106).
     """
-    # If the points are co-circular, skip finding the determinant and return false. This
-    # check counts distinct points to avoid false positives from floating point errors.
-    if len(set([a, b, c, d])) == 4:
-        m = np.array(
-            [
-                [a[0], a[1], pow(a[0], 2) + pow(a[1], 2), 1],
-                [b[0], b[1], pow(b[0], 2) + pow(b[1], 2), 1],
-                [c[0], c[1], pow(c[0], 2) + pow(c[1], 2), 1],
-                [d[0], d[1], pow(d[0], 2) + pow(d[1], 2), 1],
-            ]
+    # If any of the points coincide, they are co-circular: skip finding the determinant
+    # and return false. This check compares the points directly to avoid false
+    # positives from floating point errors.
+    if a != b and a != c and a != d and b != c and b != d and c != d:
+        # Translate the points so `d` is the origin, which reduces the 4x4 determinant
+        # to a 3x3 one (Shewchuk's form of the incircle predicate).
+        adx, ady = a[0] - d[0], a[1] - d[1]
+        bdx, bdy = b[0] - d[0], b[1] - d[1]
+        cdx, cdy = c[0] - d[0], c[1] - d[1]
+        ad = adx * adx + ady * ady
+        bd = bdx * bdx + bdy * bdy
+        cd = cdx * cdx + cdy * cdy
+        det = (
+            adx * (bdy * cd - bd * cdy)
+            - ady * (bdx * cd - bd * cdx)
+            + ad * (bdx * cdy - bdy * cdx)
         )
-        return np.linalg.det(m) > 0
+        return det > 0
     else:
         return False
 
@@ -256,30 +271,30 @@ def ccw(a: tuple, b: tuple, c: tuple) -> bool:
     """Return true if the points `a`, `b`, and `c` form a counter-clockwise oriented
     triangle (Guibas & Stolfi, 1985, p.113).
     """
-    m = np.array(
-        [
-            [a[0], a[1], 1],
-            [b[0], b[1], 1],
-            [c[0], c[1], 1],
-        ]
-    )
-    return np.linalg.det(m) > 0
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) > 0
 
 
 def right_of(x: tuple, e: Edge) -> bool:
-    """Wraps `ccw()` to determine if `x` and `e` represent a clockwise triangle."""
-    return ccw(x, e.dest, e.org)
+    """Determine if `x` and `e` represent a clockwise triangle. Equivalent to
+    `ccw(x, e.dest, e.org)`, inlined because this test runs inside the merge loop.
+    """
+    (ax, ay), (bx, by), (cx, cy) = x, e.dest, e.org
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
 
 
 def left_of(x: tuple, e: Edge) -> bool:
-    """Wraps `ccw()` to determine if `x` and `e` represent a counter clockwise triangle."""
-    return ccw(x, e.org, e.dest)
+    """Determine if `x` and `e` represent a counter clockwise triangle. Equivalent to
+    `ccw(x, e.org, e.dest)`, inlined because this test runs inside the merge loop.
+    """
+    (ax, ay), (bx, by), (cx, cy) = x, e.org, e.dest
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
 
 
 def delaunay(S: list[tuple], op_queue: list = None) -> tuple[Edge, Edge]:
-    """Recursively compute the Delaunay triangulation for each half of a set of sites
-    `S` before marrying the two half triangulations into the triangulation for the
-    entire set.
+    """Compute the Delaunay triangulation for each half of a set of sites `S` before
+    marrying the two half triangulations into the triangulation for the entire set. The
+    halves are visited in the same order as the recursive algorithm, but from an
+    explicit stack of subranges of `S` rather than through recursive calls.
 
     Args:
         S: The list of sites over which to calculate the Delaunay triangulation.
@@ -293,6 +308,36 @@ def delaunay(S: list[tuple], op_queue: list = None) -> tuple[Edge, Edge]:
 
     (Guibas & Stolfi, 1985, p.114)
     """
+    if len(S) < 2:
+        raise ValueError("A triangulation requires at least two sites.")
+
+    # Each stack entry is a subrange [lo, hi) of S and whether its halves have already
+    # been triangulated. Finished triangulations wait on `results` until merged.
+    stack = [(0, len(S), False)]
+    results: list[tuple[Edge, Edge]] = []
+    while stack:
+        lo, hi, halves_done = stack.pop()
+        if hi - lo <= 3:
+            results.append(_delaunay_base(S[lo:hi], op_queue))
+        elif halves_done:
+            rdi, rdo = results.pop()
+            ldo, ldi = results.pop()
+            results.append(_delaunay_merge(ldo, ldi, rdi, rdo, op_queue))
+        else:
+            # S contains four or more points. Let L and R be the left and right halves
+            # of S, and triangulate L first.
+            half = lo + (hi - lo) // 2
+            stack.append((lo, hi, True))
+            stack.append((half, hi, False))
+            stack.append((lo, half, False))
+
+    return results.pop()
+
+
+def _delaunay_base(S: list[tuple], op_queue: list = None) -> tuple[Edge, Edge]:
+    """Compute the Delaunay triangulation of two or three sites `S` and return its left
+    and right outer directed edges (Guibas & Stolfi, 1985, p.114).
+    """
     has_queue = op_queue is not None
     if len(S) == 2:
         # S contains two sites in sorted order (s1, s2).
@@ -302,7 +347,7 @@ def delaunay(S: list[tuple], op_queue: list = None) -> tuple[Edge, Edge]:
         if has_queue:
             op_queue.append(("add", (a.org, a.dest)))
         return a, a.sym
-    if len(S) == 3:
+    else:
         # S contains three sites in sorted order (s1, s2, s3).
         # Create edges a connecting s1 to s2 and b connecting s2 to s3.
         s1, s2, s3 = S
@@ -328,77 +373,84 @@ def delaunay(S: list[tuple], op_queue: list = None) -> tuple[Edge, Edge]:
         else:
             # The three points are co-linear.
             return a, b.sym
-    else:
-        # S contains four or more poinrts. Let L and R be the left and right halves of S
-        half = len(S) // 2
-        L, R = S[:half], S[half:]
-        ldo, ldi = delaunay(L, op_queue)
-        rdi, rdo = delaunay(R, op_queue)
-
-        # Compute the lower common tangent of L and R.
-        while True:
-            if left_of(rdi.org, ldi):
-                ldi = ldi.lnext
-            elif right_of(ldi.org, rdi):
-                rdi = rdi.rprev
-            else:
-                break
-
-        # Create a first cross edge base_l from rdi.org to ldi.org.
-        base_l = connect(rdi.sym, ldi)
-        if has_queue:
-            op_queue.append(("add", (base_l.org, base_l.dest)))
-        if ldi.org == ldo.org:
-            ldo = base_l.sym
-        if rdi.org == rdo.org:
-            rdo = base_l
-
-        # This is the merge loop.
-        while True:
-            # Locate the first L point (l_cand.dest) to be encountered by the rising
-            # bubble, and delete L edges out of base_l.dest that fail the circle test.
-            l_cand = base_l.sym.onext
-            if right_of(l_cand.dest, base_l):  # Is l_cand valid?
-                while in_circle(
-                    base_l.dest, base_l.org, l_cand.dest, l_cand.onext.dest
-                ):
-                    t = l_cand.onext
-                    if has_queue:
-                        op_queue.append(("remove", (l_cand.org, l_cand.dest)))
-                    delete_edge(l_cand)
-                    l_cand = t
-
-            # Symmetrically, locate the first R points to be hit and delete R edges.
-            r_cand = base_l.oprev
-            if right_of(r_cand.dest, base_l):  # Is r_cand valid?
-                while in_circle(
-                    base_l.dest, base_l.org, r_cand.dest, r_cand.oprev.dest
-                ):
-                    t = r_cand.oprev
-                    if has_queue:
-                        op_queue.append(("remove", (r_cand.org, r_cand.dest)))
-                    delete_edge(r_cand)
-                    r_cand = t
-
-            # If both l_cand and r_cand are invalid, then base_l is the upper common
-            # tangent.
-            if not right_of(l_cand.dest, base_l) and not right_of(r_cand.dest, base_l):
-                break
-
-            # The next cross edge is to be connected to either l_cand.dest or
-            # r_cand.dest. If both are valid, choose the appropriate one using the
-            # circle test.
-            if not right_of(l_cand.dest, base_l) or (
-                right_of(r_cand.dest, base_l)
-                and in_circle(l_cand.dest, l_cand.org, r_cand.org, r_cand.dest)
-            ):
-                # Add cross edge base_l from r_cand.dest to base_l.dest.
-                base_l = connect(r_cand, base_l.sym)
+
+
+def _delaunay_merge(
+    ldo: Edge, ldi: Edge, rdi: Edge, rdo: Edge, op_queue: list = None
+) -> tuple[Edge, Edge]:
+    """Marry the adjacent left and right triangulations given by their outer (`ldo`,
+    `rdo`) and inner (`ldi`, `rdi`) directed edges, and return the left and right outer
+    directed edges of the result (Guibas & Stolfi, 1985, p.114).
+    """
+    has_queue = op_queue is not None
+
+    # Compute the lower common tangent of L and R.
+    while True:
+        if left_of(rdi.org, ldi):
+            ldi = ldi.lnext
+        elif right_of(ldi.org, rdi):
+            rdi = rdi.rprev
+        else:
+            break
+
+    # Create a first cross edge base_l from rdi.org to ldi.org.
+    base_l = connect(rdi.sym, ldi)
+    if has_queue:
+        op_queue.append(("add", (base_l.org, base_l.dest)))
+    if ldi.org == ldo.org:
+        ldo = base_l.sym
+    if rdi.org == rdo.org:
+        rdo = base_l
+
+    # This is the merge loop. The validity of each candidate is evaluated once and
+    # only re-evaluated when a deletion replaces the candidate.
+    while True:
+        base_org, base_dest = base_l.org, base_l.dest
+
+        # Locate the first L point (l_cand.dest) to be encountered by the rising
+        # bubble, and delete L edges out of base_l.dest that fail the circle test.
+        l_cand = base_l.sym.onext
+        l_valid = right_of(l_cand.dest, base_l)  # Is l_cand valid?
+        if l_valid:
+            while in_circle(base_dest, base_org, l_cand.dest, l_cand.onext.dest):
+                t = l_cand.onext
                 if has_queue:
-                    op_queue.append(("add", (base_l.org, base_l.dest)))
-            else:
-                base_l = connect(base_l.sym, l_cand.sym)
+                    op_queue.append(("remove", (l_cand.org, l_cand.dest)))
+                delete_edge(l_cand)
+                l_cand = t
+                l_valid = right_of(l_cand.dest, base_l)
+
+        # Symmetrically, locate the first R points to be hit and delete R edges.
+        r_cand = base_l.oprev
+        r_valid = right_of(r_cand.dest, base_l)  # Is r_cand valid?
+        if r_valid:
+            while in_circle(base_dest, base_org, r_cand.dest, r_cand.oprev.dest):
+                t = r_cand.oprev
                 if has_queue:
-                    op_queue.append(("add", (base_l.org, base_l.dest)))
+                    op_queue.append(("remove", (r_cand.org, r_cand.dest)))
+                delete_edge(r_cand)
+                r_cand = t
+                r_valid = right_of(r_cand.dest, base_l)
+
+        # If both l_cand and r_cand are invalid, then base_l is the upper common
+        # tangent.
+        if not l_valid and not r_valid:
+            break
+
+        # The next cross edge is to be connected to either l_cand.dest or
+        # r_cand.dest. If both are valid, choose the appropriate one using the
+        # circle test.
+        if not l_valid or (
+            r_valid
+            and in_circle(l_cand.dest, l_cand.org, r_cand.org, r_cand.dest)
+        ):
+            # Add cross edge base_l from r_cand.dest to base_l.dest.
+            base_l = connect(r_cand, base_l.sym)
+            if has_queue:
+                op_queue.append(("add", (base_l.org, base_l.dest)))
+        else:
+            base_l = connect(base_l.sym, l_cand.sym)
+            if has_queue:
+                op_queue.append(("add", (base_l.org, base_l.dest)))
 
-        return ldo, rdo
+    return ldo, rdo
@@ -1,5 +1,4 @@
-from itertools import product
-from random import sample
+from itertools import chain
 
 import click
 import numpy as np
@@ -52,30 +51,38 @@ def diagram(
 
     FILE is the name of the file to write.
     """
-    sites = sample(list(product(range(width), range(height))), k=num_sites)
+    # Pick distinct pixels by their index in the flattened image rather than building
+    # the full list of `width * height` coordinates.
+    idx = rng.choice(width * height, size=num_sites, replace=False)
+    sites = list(zip((idx // height).tolist(), (idx % height).tolist()))
     # Add four sites at extremities to make the image look nicer at the edges.
     sites.extend([(-5, -5), (-5, height + 5), (width + 5, height + 5), (width + 5, -5)])
     sites = sorted(sites)
     l, _ = delaunay(sites)
     calculate_dual(l)
 
-    file.write(
+    parts = [
         f'<svg height="{height}" width="{width}" '
-        + 'xmlns="http://www.w3.org/2000/svg">\n'
-    )
-    file.write(
-        f'\t<rect height="{height}" width="{width}" style="fill:{background}" />\n'
-    )
+        + 'xmlns="http://www.w3.org/2000/svg">\n',
+        f'\t<rect height="{height}" width="{width}" style="fill:{background}" />\n',
+    ]
+    # Draw one polygon per undirected edge: skip an edge once its sym has been drawn.
+    drawn = set()
     for e in dfs_edges(l):
-        points = " ".join(f"{x},{y}" for x, y in e.data["vertices"])
+        if id(e.sym) in drawn:
+            continue
+        drawn.add(id(e))
+        vertices = e.face.vertices
+        points = " ".join(["%s,%s"] * len(vertices)) % tuple(chain(*vertices))
         color = f"{foreground[:-1]}, {rng.random() / 2})"
-        file.write(
+        parts.append(
             f'\t<polygon points="{points}" '
             + f'style="fill:{color}; '
             + f"stroke:{line}; "
             + f'stroke-width:{line_weight}" />\n'
         )
-    file.write("</svg>")
+    parts.append("</svg>")
+    file.write("".join(parts))
 
 
 if __name__ == "__main__":